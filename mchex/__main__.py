@@ -4,6 +4,7 @@ import json
 import logging
 import sys
 from argparse import Namespace
+from functools import lru_cache
 from importlib import metadata
 from typing import Dict, List, Optional
 from mchex.arg_types import ServerForkType
@@ -14,9 +15,7 @@ from configargparse import ArgParser, YAMLConfigFileParser
 from .command import MinecraftHexCommand, MinecraftHexCommandError
 
 
-def main(cli_flags: Optional[List[str]]) -> int:
-    mchex_commands = load_command_plugins()
-
+def main(cli_flags: Optional[List[str]] = None) -> int:
     mchex_parser = ArgParser(
         config_file_parser_class=YAMLConfigFileParser,
         default_config_files=["/etc/mchex.yaml", "~/.mchex.yaml", ".mchex.yaml"],
@@ -27,8 +26,8 @@ def main(cli_flags: Optional[List[str]]) -> int:
         prog="mchex",
     )
     mchex_parser.add_argument(
-        "log-level",
-        "l",
+        "--log-level",
+        "-l",
         action="store",
         default="warning",
         type=str,
@@ -36,71 +35,110 @@ def main(cli_flags: Optional[List[str]]) -> int:
         help="Level of log messages to print",
     )
     mchex_parser.add_argument(
-        "server-dir",
-        "d",
+        "--server-dir",
+        "-d",
         default="./",
         type=path.local,
         help="Server directory path",
     )
+    # No -h short flag; argparse reserves it for help
     mchex_parser.add_argument(
-        "host", "h", default="localhost", type=str, help="Server hostname or IP address"
+        "--host", default="localhost", type=str, help="Server hostname or IP address"
     )
     mchex_parser.add_argument(
-        "port", "p", default=25565, type=int, help="Port the server is listening on"
+        "--port", "-p", default=25565, type=int, help="Port the server is listening on"
     )
     mchex_parser.add_argument(
-        "server-fork",
-        "f",
+        "--server-fork",
+        "-f",
         default="vanilla",
         type=ServerForkType,
         dest="server_fork",
         help="Type of server (eg. vanilla, bedrock, paper, etc)",
     )
 
-    command_subparsers = mchex_parser.add_subparsers()
-    command_subparsers.choices = mchex_commands.values()
+    # Only register command names here; the selected command plugin is
+    # imported after parsing so a run never imports the commands it skips
+    mchex_parser.add_argument(
+        "mchex_cmd",
+        choices=command_plugin_names(),
+        help="Command to run",
+    )
 
-    mchex_args: Namespace = mchex_parser.parse_args(args=cli_flags)
-    mchex_cmd_name = mchex_args.get("mchex_cmd")
-    mchex_cmd = mchex_commands[mchex_cmd_name]
+    mchex_args, command_flags = mchex_parser.parse_known_args(args=cli_flags)
+    mchex_cmd_name = mchex_args.mchex_cmd
+    mchex_cmd = load_command_plugin(mchex_cmd_name)
+    mchex_args = mchex_cmd.parse_args(args=command_flags, namespace=mchex_args)
 
     try:
         result = mchex_cmd(mchex_args)
     except Exception as err:
-        msg = f"Encountered error running command {mchex_cmd_name}: {str(err)}"
-        if mchex_args.log_level == logging.DEBUG:
-            logging.error(msg, exc_info=err)
+        # Lazy %s formatting so the message is only built when the
+        # record is actually emitted
+        if mchex_args.log_level == "debug":
+            logging.error(
+                "Encountered error running command %s: %s",
+                mchex_cmd_name,
+                err,
+                exc_info=err,
+            )
         else:
-            logging.error(msg)
+            logging.error(
+                "Encountered error running command %s: %s", mchex_cmd_name, err
+            )
 
         return err.err_code if isinstance(err, MinecraftHexCommandError) else 255
 
-    json.dump(result, sort_keys=True, indent=4)
+    print(json.dumps(result, sort_keys=True, indent=4))
 
     return result
 
 
-def load_command_plugins() -> Dict[str, MinecraftHexCommand]:
-    commands = {}
-    for entrypoint in metadata.entry_points()["mchex.cmds"]:
-        if entrypoint.name in commands:
+@lru_cache(maxsize=1)
+def _mchex_entry_points() -> metadata.EntryPoints:
+    # importlib.metadata re-parses every installed distribution on each
+    # entry_points() call, so cache the filtered group for the process
+    entrypoints = metadata.entry_points()
+    if hasattr(entrypoints, "select"):  # Python 3.10+
+        return entrypoints.select(group="mchex.cmds")
+
+    return entrypoints.get("mchex.cmds", ())
+
+
+def command_plugin_names() -> List[str]:
+    names = []
+    for entrypoint in _mchex_entry_points():
+        if entrypoint.name in names:
             raise AttributeError(
                 f"{entrypoint.name} conflicts with another plugin with the same name"
             )
 
+        names.append(entrypoint.name)
+
+    return sorted(names)
+
+
+def load_command_plugin(name: str) -> MinecraftHexCommand:
+    for entrypoint in _mchex_entry_points():
+        if entrypoint.name != name:
+            continue
+
         mchex_cmd_parser_cls = entrypoint.load()
-        if not isinstance(mchex_cmd_parser_cls, MinecraftHexCommand):
+        if not (
+            isinstance(mchex_cmd_parser_cls, type)
+            and issubclass(mchex_cmd_parser_cls, MinecraftHexCommand)
+        ):
             raise TypeError(
                 f"{entrypoint} is not a Minecraft Hex Command, must be a "
                 f"{MinecraftHexCommand.__name__} object"
             )
 
         mchex_cmd_parser: MinecraftHexCommand = mchex_cmd_parser_cls()
-        mchex_cmd_parser.set_defaults(mchex_cmd=entrypoint.name)
+        mchex_cmd_parser.set_defaults(mchex_cmd=name)
 
-        commands[entrypoint.name] = mchex_cmd_parser
+        return mchex_cmd_parser
 
-    return commands
+    raise KeyError(f"no mchex command plugin named {name} is installed")
 
 
 if __name__ == "__main__":
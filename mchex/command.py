@@ -1,9 +1,21 @@
 #!/usr/bin/env python3
 
-from asyncio import iscoroutine, run
+from abc import ABC, abstractmethod
 from argparse import ArgumentParser, Namespace
-from abs import ABC, abstractmethod
-from typing import Any, Dict
+from asyncio import AbstractEventLoop, iscoroutinefunction, new_event_loop
+from typing import Any, Dict, Optional
+
+_loop: Optional[AbstractEventLoop] = None
+
+
+def _event_loop() -> AbstractEventLoop:
+    # One event loop shared by every dispatched command so each call
+    # skips the loop spin-up and teardown asyncio.run would pay
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = new_event_loop()
+
+    return _loop
 
 
 class MinecraftHexCommandError(Exception):
@@ -18,8 +30,7 @@ class MinecraftHexCommand(ArgumentParser, ABC):
         raise NotImplementedError()
 
     def __call__(self, args: Namespace) -> Dict[str, Any]:
-        if iscoroutine(self.run):
-            return await run(self.run(args))
+        if iscoroutinefunction(self.run):
+            return _event_loop().run_until_complete(self.run(args))
 
-        else:
-            return run(self.run(args))
+        return self.run(args)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Persistent cache for server fork entry-point discovery.
+
+Entry-point discovery walks every installed distribution's metadata,
+which a short-lived CLI process re-pays on every start. This module
+stores the resolved `{short_name: "module:attr"}` map in a small sqlite
+database keyed by the interpreter path and the newest site-packages
+mtime, so warm starts replace the metadata walk with one SELECT. Any
+change to the installed environment rolls the key and invalidates the
+cached row.
+"""
+
+import json
+import os
+import site
+import sqlite3
+import sys
+from typing import Dict, Optional
+
+
+def _cache_path() -> str:
+    """Location of the sqlite database holding discovery results."""
+    return os.path.join(
+        os.path.expanduser("~"), ".cache", "mchex", "fork_cache.sqlite3"
+    )
+
+
+def _environment_key() -> str:
+    """Key identifying the current interpreter and installed packages."""
+    try:
+        newest_mtime = max(
+            os.path.getmtime(packages_dir)
+            for packages_dir in site.getsitepackages()
+            if os.path.isdir(packages_dir)
+        )
+    except (ValueError, OSError, AttributeError):
+        # No readable site-packages (eg. some virtualenv layouts); fall
+        # back to never matching so discovery always runs
+        return ""
+
+    return f"{sys.executable}:{newest_mtime}"
+
+
+def load() -> Optional[Dict[str, str]]:
+    """Read the cached fork import paths for this environment, if any.
+
+    :return: The `{short_name: "module:attr"}` map, or None on a miss.
+    """
+    key = _environment_key()
+    if not key:
+        return None
+
+    try:
+        with sqlite3.connect(_cache_path()) as connection:
+            row = connection.execute(
+                "SELECT payload FROM forks WHERE key = ?", (key,)
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+
+    if row is None:
+        return None
+
+    try:
+        return json.loads(row[0])
+    except ValueError:
+        return None
+
+
+def store(import_paths: Dict[str, str]) -> None:
+    """Persist the resolved fork import paths for this environment.
+
+    Failures are swallowed; the cache is purely an accelerator and the
+    next process simply re-runs discovery.
+
+    :param import_paths: Map of fork short name to `module:attr` path.
+    """
+    key = _environment_key()
+    if not key:
+        return
+
+    try:
+        os.makedirs(os.path.dirname(_cache_path()), exist_ok=True)
+        with sqlite3.connect(_cache_path()) as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS forks "
+                "(key TEXT PRIMARY KEY, payload BLOB)"
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO forks VALUES (?, ?)",
+                (key, json.dumps(import_paths)),
+            )
+    except (sqlite3.Error, OSError):
+        pass
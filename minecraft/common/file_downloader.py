@@ -2,9 +2,12 @@
 """Async classes to help download files over HTTP."""
 
 from collections.abc import Awaitable
-from asyncio import create_task, Task, CancelledError
+from asyncio import create_task, gather, to_thread, Task, CancelledError
 from httpx import AsyncClient as HttpAsyncClient
 from tempfile import mkstemp
+from time import monotonic
+
+from .http_client import get_client
 import hashlib
 import os
 
@@ -18,6 +21,33 @@ from typing import (
 )
 from warnings import warn
 
+try:
+    import blake3 as _blake3
+except ImportError:  # Optional parallel-hashing backend
+    _blake3 = None
+
+
+#: Size in bytes of each chunk requested from the HTTP stream.
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+#: Starting number of buffered bytes that triggers a flush to disk.
+DOWNLOAD_FLUSH_MIN_SIZE = 1 << 16
+
+#: Largest number of buffered bytes allowed before a flush to disk.
+DOWNLOAD_FLUSH_SIZE = 1 << 20
+
+#: Target seconds between flushes used to tune the flush threshold.
+DOWNLOAD_FLUSH_INTERVAL = 0.25
+
+#: Number of concurrent HTTP range requests used for large downloads.
+RANGED_DOWNLOAD_SEGMENTS = 4
+
+#: Smallest expected file size in bytes that downloads in ranged segments.
+RANGED_DOWNLOAD_MIN_SIZE = 4 << 20
+
+#: Sentinel marking a download context's stat cache as unpopulated.
+_STAT_UNSET = object()
+
 
 class FileDownladException(Exception):
     """Base exception for file download errors."""
@@ -25,6 +55,61 @@ class FileDownladException(Exception):
     pass
 
 
+def _write_chunks(file_descriptor: int, chunks: list) -> None:
+    """Drain a list of buffered chunks to disk in as few syscalls as possible.
+
+    Uses :func:`os.writev` where the platform provides it so the buffered
+    chunks go down in one kernel transition without being joined into a
+    fresh bytes object first.
+
+    :param file_descriptor: Open file descriptor to write to.
+    :param chunks: Buffered chunks to write, drained in order.
+    """
+    if not hasattr(os, "writev"):
+        os.write(file_descriptor, b"".join(chunks))
+        return
+
+    remaining = list(chunks)
+    while remaining:
+        written = os.writev(file_descriptor, remaining)
+        while remaining and written >= len(remaining[0]):
+            written -= len(remaining[0])
+            remaining.pop(0)
+
+        if written and remaining:
+            remaining[0] = remaining[0][written:]
+
+
+def _hash_file(
+    filename: str, file_hash_type: Callable[[], "hashlib._hashlib.HASH"]
+) -> bytes:
+    """Hash a file on disk using a fixed-size read buffer.
+
+    :param filename: Path of the file to hash.
+    :param file_hash_type: :class:`hashlib` method representing the hash type.
+    :return: Hash digest of the file in bytes.
+    """
+    # Tree hashes can fan chunks out across cores; blake3 does this
+    # natively over a memory map when the optional package is installed.
+    # MD5/SHA rounds are order-dependent, so those stay sequential.
+    if _blake3 is not None and isinstance(file_hash_type(), _blake3.blake3):
+        hasher = _blake3.blake3(max_threads=_blake3.blake3.AUTO)
+        hasher.update_mmap(filename)
+        return hasher.hexdigest().encode()
+
+    with open(filename, "rb") as file_handle:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            hasher = hashlib.file_digest(file_handle, file_hash_type)
+        else:
+            # Stream the file through a fixed-size buffer instead of
+            # loading it into memory all at once
+            hasher = file_hash_type()
+            while chunk := file_handle.read(1 << 18):
+                hasher.update(chunk)
+
+    return hasher.hexdigest().encode()
+
+
 class FileDownloader:
     """HTTP based file download manager."""
 
@@ -46,6 +131,7 @@ class FileDownloader:
         self.url = url
         self.expected_size = expected_size
         self.file_hash_type = file_hash_type
+        self._template_hasher = file_hash_type() if file_hash_type else None
 
         self.file_hash = None
         if file_hash:
@@ -53,6 +139,17 @@ class FileDownloader:
                 file_hash if isinstance(file_hash, bytes) else file_hash.encode()
             )
 
+    def _new_hasher(self):
+        """Fork a fresh hasher from the template constructed at init.
+
+        `.copy()` duplicates the hasher's internal state in C without
+        re-running the hash context setup, which adds up when many files
+        are verified in a batch.
+
+        :return: A fresh hasher object, or None when no hash type is set.
+        """
+        return self._template_hasher.copy() if self._template_hasher else None
+
     def download(
         self,
         filename: str,
@@ -105,13 +202,35 @@ class FileDownloadContext(Awaitable):
             self.downloader.expected_size if self.downloader.expected_size else -1.0
         )
         self.download_size = 0
+        self._computed_digest: Optional[bytes] = None
+        self._stat_cache = _STAT_UNSET
+
+    def _stat(self) -> Optional[os.stat_result]:
+        """Stat the local file, memoizing the result until invalidated.
+
+        Verification methods all consult the same cached stat so a verify
+        pass costs one stat syscall instead of one per check.
+
+        :return: The file's stat result, or None if the file does not exist
+        """
+        if self._stat_cache is _STAT_UNSET:
+            try:
+                self._stat_cache = os.stat(self.filename)
+            except (FileNotFoundError, NotADirectoryError):
+                self._stat_cache = None
+
+        return self._stat_cache
+
+    def _invalidate_stat(self) -> None:
+        """Drop the cached stat after the file on disk changes."""
+        self._stat_cache = _STAT_UNSET
 
     def exists(self) -> bool:
         """Check if the local file exists.
 
         :return: True if the local file exists
         """
-        return os.path.isfile(self.filename)
+        return self._stat() is not None
 
     @property
     def filehash(self) -> bytes:
@@ -128,11 +247,28 @@ class FileDownloadContext(Awaitable):
                 "downloader"
             )
 
-        hasher = self.downloader.file_hash_type()
-        with open(self.filename, "r+b") as file_handle:
-            hasher.update(file_handle.read())
+        return _hash_file(self.filename, self.downloader._new_hasher)
 
-        return hasher.hexdigest().encode()
+    async def afilehash(self) -> bytes:
+        """Hash of the file in bytes, computed in a worker thread.
+
+        Offloads the blocking disk read to a thread so other tasks on the
+        event loop keep running while a large file is hashed.
+
+        :return: Hash digest of the file in bytes
+        """
+        if not self.exists():
+            raise FileNotFoundError(f"The file {self.filename} does not exist")
+
+        if not self.downloader.file_hash_type:
+            raise AttributeError(
+                f"hash method for file {self.filename} is not provided in the "
+                "downloader"
+            )
+
+        return await to_thread(
+            _hash_file, self.filename, self.downloader._new_hasher
+        )
 
     @property
     def filesize(self) -> int:
@@ -140,10 +276,11 @@ class FileDownloadContext(Awaitable):
 
         :return: Size of file in bytes
         """
-        if not self.exists():
+        stat = self._stat()
+        if stat is None:
             raise FileNotFoundError(f"file {self.filename} does not exist")
 
-        return os.path.getsize(self.filename)
+        return stat.st_size
 
     def downloading(self) -> bool:
         """Check if the file is downloading.
@@ -200,6 +337,10 @@ class FileDownloadContext(Awaitable):
     def verify_hash(self) -> bool:
         """Verify the hash using the downloader's hash method and digest.
 
+        The digest computed while the download streamed is preferred; the
+        file is only re-read when the download didn't run in this context
+        (eg. the file already existed on disk).
+
         :return: True if the file digest matches the downloader's expected hash,
             else False.
         """
@@ -217,6 +358,9 @@ class FileDownloadContext(Awaitable):
                 )
             return True
 
+        if self._computed_digest is not None:
+            return self._computed_digest == self.downloader.file_hash
+
         return self.filehash == self.downloader.file_hash
 
     def verify_size(self) -> bool:
@@ -248,10 +392,139 @@ class FileDownloadContext(Awaitable):
         """
         return self.exists() and self.verify_hash() and self.verify_size()
 
+    async def __download_stream(self, client: HttpAsyncClient, tmp_file: int) -> None:
+        """Download the remote file over a single HTTP stream."""
+        async with client.stream("GET", self.downloader.url) as streamer:
+            self.download_expected_size = int(streamer.headers["Content-Length"])
+            self.download_size = 0
+
+            # Buffer chunks and flush them in large writes so the
+            # syscall count stays low on fast links. Hash the chunks
+            # as they arrive so verification doesn't re-read the file.
+            hasher = self.downloader._new_hasher()
+            # aiter_raw skips httpx's content-decoding layer and its
+            # per-chunk accounting; download payloads are binary files
+            # that are never served content-encoded
+            # The flush threshold adapts to the observed throughput: fast
+            # links that refill the buffer quickly get larger, rarer
+            # flushes (up to 1 MiB), slow links flush small buffers so
+            # progress still reaches disk regularly
+            pending = []
+            pending_size = 0
+            flush_size = DOWNLOAD_FLUSH_MIN_SIZE
+            last_flush = monotonic()
+            async for chunk in streamer.aiter_raw(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                # Hand the hasher and the write buffer the same memoryview
+                # so the chunk's bytes are never duplicated
+                chunk_view = memoryview(chunk)
+                if hasher:
+                    hasher.update(chunk_view)
+
+                pending.append(chunk_view)
+                pending_size += len(chunk_view)
+                if pending_size >= flush_size:
+                    _write_chunks(tmp_file, pending)
+                    pending.clear()
+                    pending_size = 0
+
+                    now = monotonic()
+                    elapsed = now - last_flush
+                    last_flush = now
+                    if elapsed < DOWNLOAD_FLUSH_INTERVAL:
+                        flush_size = min(flush_size * 2, DOWNLOAD_FLUSH_SIZE)
+                    elif elapsed > 4 * DOWNLOAD_FLUSH_INTERVAL:
+                        flush_size = max(flush_size // 2, DOWNLOAD_FLUSH_MIN_SIZE)
+
+                self.download_size = streamer.num_bytes_downloaded
+
+            if pending:
+                _write_chunks(tmp_file, pending)
+                pending.clear()
+
+            if hasher:
+                self._computed_digest = hasher.hexdigest().encode()
+
+    async def __download_ranged(
+        self, client: HttpAsyncClient, tmp_file: int
+    ) -> bool:
+        """Download the remote file as concurrent HTTP range segments.
+
+        Issues :const:`RANGED_DOWNLOAD_SEGMENTS` concurrent range requests
+        so high-latency links aren't gated on a single TCP window. Segments
+        land out of order, so the hash cannot be computed while streaming;
+        verification falls back to re-reading the finished file.
+
+        :param client: HTTP client issuing the range requests.
+        :param tmp_file: File descriptor of the temporary download file.
+        :return: True if the ranged download ran, False if the server does
+            not support range requests and the caller should fall back to a
+            single stream.
+        """
+        try:
+            probe = await client.head(self.downloader.url)
+        except Exception:
+            return False
+
+        if probe.status_code != 200:
+            return False
+
+        if probe.headers.get("Accept-Ranges", "").lower() != "bytes":
+            return False
+
+        total = int(probe.headers.get("Content-Length", 0))
+        if not total:
+            return False
+
+        self.download_expected_size = total
+        self.download_size = 0
+
+        async def fetch_segment(start: int, end: int) -> None:
+            async with client.stream(
+                "GET",
+                self.downloader.url,
+                headers={"Range": f"bytes={start}-{end}"},
+            ) as streamer:
+                # A server that ignores the Range header answers 200 with
+                # the full body, and errors arrive as 416/5xx pages; writing
+                # either at this offset would corrupt the file
+                if streamer.status_code != 206:
+                    raise FileDownladException(
+                        f"expected 206 for range {start}-{end}, got "
+                        f"{streamer.status_code}"
+                    )
+
+                offset = start
+                async for chunk in streamer.aiter_raw(
+                    chunk_size=DOWNLOAD_CHUNK_SIZE
+                ):
+                    os.pwrite(tmp_file, chunk, offset)
+                    offset += len(chunk)
+                    self.download_size += len(chunk)
+
+        segment_size = -(-total // RANGED_DOWNLOAD_SEGMENTS)
+        # return_exceptions so every sibling segment has finished writing
+        # before the temp file is discarded for the fallback
+        results = await gather(
+            *(
+                fetch_segment(start, min(start + segment_size, total) - 1)
+                for start in range(0, total, segment_size)
+            ),
+            return_exceptions=True,
+        )
+        if any(isinstance(result, BaseException) for result in results):
+            os.ftruncate(tmp_file, 0)
+            self.download_size = 0
+            return False
+
+        return True
+
     async def __download(self) -> bool:
+        # Refuse to overwrite before any temp file or network work is done,
+        # so the common re-run case costs one stat instead of a TLS handshake
+        self._invalidate_stat()
         if self.exists() and not self.overwrite:
             raise FileDownladException(
-                f"File {self.file_path} exists and overwriting is not permitted"
+                f"File {self.filename} exists and overwriting is not permitted"
             )
 
         try:
@@ -261,15 +534,17 @@ class FileDownloadContext(Awaitable):
                 tmp_filename,
             ) = mkstemp()
 
-            # Start downloading the file from an HTTP stream
-            client = HttpAsyncClient()
-            async with client.stream("GET", self.downloader.url) as streamer:
-                self.download_expected_size = int(streamer.headers["Content-Length"])
-                self.download_size = 0
-
-                async for chunk in streamer.aiter_bytes():
-                    os.write(tmp_file, bytes([chunk]))
-                    self.download_size = streamer.num_bytes_downloaded
+            # Start downloading the file from an HTTP stream; large files
+            # are fetched as concurrent range segments when the server
+            # supports it so the TCP pipeline stays full
+            client = get_client()
+            ranged = (
+                self.downloader.expected_size is not None
+                and self.downloader.expected_size >= RANGED_DOWNLOAD_MIN_SIZE
+                and await self.__download_ranged(client, tmp_file)
+            )
+            if not ranged:
+                await self.__download_stream(client, tmp_file)
 
             os.fsync(tmp_file)
 
@@ -283,6 +558,8 @@ class FileDownloadContext(Awaitable):
             else:
                 os.rename(tmp_filename, self.filename)
 
+            self._invalidate_stat()
+
             # Check file integrity
             if not self.verify_size():
                 raise FileDownladException(
@@ -291,16 +568,19 @@ class FileDownloadContext(Awaitable):
                 )
 
             if not self.verify_hash():
+                actual_hash = self._computed_digest or await self.afilehash()
                 raise FileDownladException(
                     "failed to verify file integrity, expected "
-                    f"'{self.downloader.file_hash}' but got '{self.filehash}'"
+                    f"'{self.downloader.file_hash}' but got '{actual_hash}'"
                 )
 
         finally:
             # Clean up the temporary file
             os.close(tmp_file)
-            if os.path.exists(tmp_filename):
+            try:
                 os.remove(tmp_filename)
+            except FileNotFoundError:
+                pass
 
         return True
 
@@ -424,6 +704,7 @@ class NamedFileDownloader(FileDownloader):
         )
         self.filename = filename
         self.relative_file_path = relative_file_path
+        self._resolved_dirs: dict = {}
 
     def download(
         self,
@@ -438,9 +719,16 @@ class NamedFileDownloader(FileDownloader):
         :param no_warnings: Suppress all warnings (default=False)
         :return: :class:`FileDownloadContext`_ context manager for the file download.
         """
-        file_path = os.path.realpath(
-            os.path.join(download_dir, self.relative_file_path, self.filename)
-        )
+        # realpath stats every path component to resolve symlinks, so the
+        # resolved directory is cached per download location
+        resolved_dir = self._resolved_dirs.get(download_dir)
+        if resolved_dir is None:
+            resolved_dir = os.path.realpath(
+                os.path.join(download_dir, self.relative_file_path)
+            )
+            self._resolved_dirs[download_dir] = resolved_dir
+
+        file_path = os.path.join(resolved_dir, self.filename)
         return FileDownloadContext(
             self,
             file_path,
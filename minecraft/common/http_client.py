@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Shared HTTP client so the whole library reuses pooled connections."""
+
+import asyncio
+import atexit
+import threading
+from importlib.util import find_spec
+from typing import Optional
+
+from httpx import AsyncClient as HttpAsyncClient
+from httpx import Limits, Timeout
+
+_client: Optional[HttpAsyncClient] = None
+_client_lock = threading.Lock()
+
+#: Pool sizing for the shared client: enough keepalive connections for
+#: chained manifest/metadata lookups plus parallel JAR downloads.
+_CLIENT_LIMITS = Limits(max_keepalive_connections=20, max_connections=100)
+
+#: Bound how long a stuck host can hold up a command; connects fail
+#: faster than reads so DNS/hole-punching problems surface early.
+_CLIENT_TIMEOUT = Timeout(10.0, connect=5.0)
+
+
+def get_client() -> HttpAsyncClient:
+    """Get the library-wide HTTP client, creating it on first use.
+
+    A single client keeps TCP+TLS connections alive between requests, so
+    chained JSON lookups and file downloads against the same host skip the
+    handshake after the first request. HTTP/2 multiplexing is enabled when
+    the optional `h2` package is installed.
+
+    :return: The shared :class:`httpx.AsyncClient`.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        # Double-checked lock so concurrent first calls from worker
+        # threads don't construct (and leak) extra clients
+        with _client_lock:
+            if _client is None or _client.is_closed:
+                _client = HttpAsyncClient(
+                    http2=find_spec("h2") is not None,
+                    limits=_CLIENT_LIMITS,
+                    timeout=_CLIENT_TIMEOUT,
+                )
+
+    return _client
+
+
+async def aclose_client() -> None:
+    """Close the shared HTTP client and drop its pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _aclose_client_at_exit() -> None:
+    """Best-effort close of the shared client at interpreter shutdown."""
+    if _client is not None and not _client.is_closed:
+        try:
+            asyncio.run(aclose_client())
+        except RuntimeError:
+            pass
+
+
+atexit.register(_aclose_client_at_exit)
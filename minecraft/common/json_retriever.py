@@ -1,13 +1,93 @@
 #!/usr/bin/env python3
 """Helper classes to retrieve and parse JSON from HTTP sources."""
 
-from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
-from httpx import AsyncClient as HttpAsyncClient
+import hashlib
 import json
+import os
+import time
+from abc import ABC, abstractmethod
+from asyncio import Task, create_task
+from tempfile import mkstemp
+from typing import Any, Dict, List, Optional, Set, Union
+
+from .http_client import get_client
+
+try:
+    # orjson parses JSON bytes directly in C, skipping the str decode pass
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
 
 T_JSON_RESULT = Union[Dict[str, Any], List[Any]]
 
+#: Seconds a cached JSON response is served without hitting the network.
+CACHE_TTL = 3600
+
+#: Background cache refresh tasks, referenced so they aren't garbage collected.
+_refresh_tasks: Set[Task] = set()
+
+
+def _cache_dir() -> str:
+    """Directory holding cached JSON responses."""
+    return os.path.join(os.path.expanduser("~"), ".cache", "mchex")
+
+
+def _cache_path(url: str) -> str:
+    """Cache file location for a JSON source URL."""
+    return os.path.join(
+        _cache_dir(), f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+    )
+
+
+def _validators_path(url: str) -> str:
+    """Location of the cached HTTP validators for a JSON source URL."""
+    return f"{_cache_path(url)}.meta"
+
+
+def _write_cache(url: str, content: bytes, validators: Dict[str, str]) -> None:
+    """Atomically store a JSON response and its HTTP validators.
+
+    Persistence is best-effort: an unwritable cache directory must never
+    fail a load() whose HTTP fetch already succeeded.
+    """
+    tmp_filename = None
+    try:
+        os.makedirs(_cache_dir(), exist_ok=True)
+        tmp_file, tmp_filename = mkstemp(dir=_cache_dir())
+        os.write(tmp_file, content)
+        os.close(tmp_file)
+        os.replace(tmp_filename, _cache_path(url))
+        if validators:
+            with open(_validators_path(url), "w") as file_handle:
+                json.dump(validators, file_handle)
+    except OSError:
+        if tmp_filename is not None:
+            # The temp file is gone if the failure came after os.replace
+            try:
+                os.remove(tmp_filename)
+            except FileNotFoundError:
+                pass
+
+
+def _read_validators(url: str) -> Dict[str, str]:
+    """Read the conditional request headers cached for a URL, if any."""
+    try:
+        with open(_validators_path(url)) as file_handle:
+            return json.load(file_handle)
+    except (OSError, ValueError):
+        return {}
+
+
+def _read_cache(url: str) -> "tuple[Optional[bytes], Optional[float]]":
+    """Read a URL's cached JSON response and its age in seconds, if any."""
+    try:
+        cache_file = _cache_path(url)
+        age = time.time() - os.path.getmtime(cache_file)
+        with open(cache_file, "rb") as file_handle:
+            return file_handle.read(), age
+    except OSError:
+        return None, None
+
 
 class HttpJsonRetriever(ABC):
     """Abstract class for retrieving JSON over the HTTP/S protocol.
@@ -18,6 +98,9 @@ class HttpJsonRetriever(ABC):
     :param URL: Default url to retrieve JSON result from.
     """
 
+    # Empty slots so slotted subclasses don't inherit a __dict__ anyway
+    __slots__ = ()
+
     URL: Optional[str] = None
 
     @abstractmethod
@@ -30,10 +113,81 @@ class HttpJsonRetriever(ABC):
         """
         ...
 
+    @classmethod
+    def _parse(klass, raw: bytes) -> T_JSON_RESULT:
+        """Parse a raw JSON response body into Python objects.
+
+        Subclasses with large payloads can override this to plug in a
+        lazy parser (eg. pysimdjson's on-demand API) that materializes
+        only the keys their constructor actually reads.
+
+        :param raw: Raw JSON response body.
+        :return: The decoded JSON document.
+        """
+        return _loads(raw)
+
+    @classmethod
+    async def _fetch(klass, url: str) -> bytes:
+        """Fetch the raw JSON body from the HTTP/S url and cache it on disk.
+
+        When the cache holds validators for the URL a conditional GET is
+        sent (`If-None-Match`/`If-Modified-Since`); a 304 answer re-dates
+        the cached body instead of re-downloading the ~200KB manifest.
+
+        :param url: Url to fetch JSON from.
+        :return: The raw JSON response body.
+        """
+        request_headers = {}
+        validators = _read_validators(url)
+        if validators.get("etag"):
+            request_headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            request_headers["If-Modified-Since"] = validators["last_modified"]
+
+        if request_headers:
+            response = await get_client().get(url, headers=request_headers)
+        else:
+            response = await get_client().get(url)
+
+        if response.status_code == 304:
+            cached, _ = _read_cache(url)
+            if cached is not None:
+                os.utime(_cache_path(url))
+                return cached
+            # Validators without a body; refetch unconditionally
+            response = await get_client().get(url)
+
+        # Never cache an error body: a transient 5xx during a refresh
+        # must not replace a known-good entry with unparseable HTML
+        response.raise_for_status()
+
+        new_validators = {}
+        if response.headers.get("ETag"):
+            new_validators["etag"] = response.headers["ETag"]
+        if response.headers.get("Last-Modified"):
+            new_validators["last_modified"] = response.headers["Last-Modified"]
+
+        _write_cache(url, response.content, new_validators)
+        return response.content
+
+    @classmethod
+    async def _refresh_cache(klass, url: str) -> None:
+        """Refresh a stale cache entry, tolerating fetch failures."""
+        try:
+            await klass._fetch(url)
+        except Exception:
+            # Stale results keep being served until a refresh succeeds
+            pass
+
     @classmethod
     async def load(klass, url: Optional[str] = None) -> "HttpJsonRetriever":
         """Fetch the JSON from the HTTP/S url and convert it into a class.
 
+        Results are cached on disk. A cache entry younger than
+        :const:`CACHE_TTL` is served without any network traffic; older
+        entries are served stale while a background task revalidates them,
+        so commands stay fast (and usable offline) once a result is cached.
+
         :param url: Url to fetch JSON from.
         warning:: Passing a URL overrides the default class url and may
         retreive results that cannot be processed by the class constructor.
@@ -47,9 +201,13 @@ class HttpJsonRetriever(ABC):
                 f"no default url has been defined for class {klass.__name__}"
             )
 
-        async with HttpAsyncClient() as client:
-            response = await client.get(actual_url)
+        cached, age = _read_cache(actual_url)
+        if cached is not None:
+            if age > CACHE_TTL:
+                refresh_task = create_task(klass._refresh_cache(actual_url))
+                _refresh_tasks.add(refresh_task)
+                refresh_task.add_done_callback(_refresh_tasks.discard)
 
-            return klass(json.loads(response.text))
+            return klass(klass._parse(cached))
 
-        raise RuntimeError("An unknown exception has occurred.")
+        return klass(klass._parse(await klass._fetch(actual_url)))
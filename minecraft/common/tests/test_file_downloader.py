@@ -40,12 +40,12 @@ def mock_httpx_stream(mocker):
     mock_http_streamer.headers = {
         "Content-Length": test_size,
     }
-    mock_http_streamer.aiter_bytes.return_value.__aiter__.return_value = test_bytes
+    mock_http_streamer.aiter_raw.return_value.__aiter__.return_value = [test_bytes]
     mock_http_streamer.num_bytes_downloaded = len(test_bytes)
 
     mock_stream_ctx_mngr = MagicMock()
-    mock_http_client = mocker.patch("minecraft.common.file_downloader.HttpAsyncClient")
-    mock_http_client.return_value.stream.return_value = mock_stream_ctx_mngr
+    mock_get_client = mocker.patch("minecraft.common.file_downloader.get_client")
+    mock_get_client.return_value.stream.return_value = mock_stream_ctx_mngr
     mock_stream_ctx_mngr.__aenter__.return_value = mock_http_streamer
 
     yield test_url, test_size, test_hash
@@ -79,6 +79,7 @@ async def test_async_with_file_download(temp_file, mock_httpx_stream):
     assert download.verify_hash()
     assert download.verify_size()
     assert download.verify()
+    assert await download.afilehash() == download.filehash
     assert 1.0 == download.download_progress()
 
 
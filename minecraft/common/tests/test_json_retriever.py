@@ -3,30 +3,34 @@
 
 import pytest
 from unittest.mock import AsyncMock, MagicMock
-from httpx import AsyncClient, Response
+from httpx import AsyncClient, HTTPStatusError, Response
 
 from minecraft.common import json_retriever
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, mocker):
+    """Point the JSON response cache at a per-test temporary directory."""
+    mocker.patch.object(json_retriever, "_cache_dir", return_value=str(tmp_path))
+
+
 @pytest.fixture
 def mock_httpx_client(mocker):
     """Provide a mock HTTPX object for :py:mod:`minecraft.common.json_retriever`_.
 
-    This mock handles the async context management so that the test only has to
+    The retriever uses the shared library client, so the test only has to
     implement the client's method calls.
     """
     mock_http_client = AsyncMock(spec=AsyncClient)
-    mock_http_client.__aenter__.return_value = mock_http_client
 
-    mock_http_client_func = mocker.patch(
-        "minecraft.common.json_retriever.HttpAsyncClient",
+    mock_get_client = mocker.patch(
+        "minecraft.common.json_retriever.get_client",
     )
-    mock_http_client_func.return_value = mock_http_client
+    mock_get_client.return_value = mock_http_client
 
     yield mock_http_client
 
-    mock_http_client_func.assert_called_once()
-    mock_http_client.__aenter__.assert_called_once()
+    mock_get_client.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -43,8 +47,10 @@ async def test_load(mock_httpx_client):
             self.thoughts = parsed_json["thoughts?"]
 
     http_response = MagicMock(Response)
-    http_response.text = (
-        '{"test": 123, "hello": "world", "thoughts?": ["no", "6969", "2121"]}'
+    http_response.status_code = 200
+    http_response.headers = {}
+    http_response.content = (
+        b'{"test": 123, "hello": "world", "thoughts?": ["no", "6969", "2121"]}'
     )
     mock_httpx_client.get.return_value = http_response
 
@@ -56,6 +62,13 @@ async def test_load(mock_httpx_client):
     assert test_result.hello == "world"
     assert test_result.thoughts == ["no", "6969", "2121"]
 
+    # A fresh cache entry is served without another HTTP fetch
+    cached_result = await TestJsonRetrieverClass.load(url=test_url)
+    mock_httpx_client.get.assert_called_once_with(test_url)
+    assert cached_result.test_val == 123
+    assert cached_result.hello == "world"
+    assert cached_result.thoughts == ["no", "6969", "2121"]
+
 
 @pytest.mark.asyncio
 async def test_load_with_default_url(mock_httpx_client):
@@ -73,8 +86,10 @@ async def test_load_with_default_url(mock_httpx_client):
             self.thoughts = parsed_json["thoughts?"]
 
     http_response = MagicMock(Response)
-    http_response.text = (
-        '{"test": 123, "hello": "world", "thoughts?": ["no", "6969", "2121"]}'
+    http_response.status_code = 200
+    http_response.headers = {}
+    http_response.content = (
+        b'{"test": 123, "hello": "world", "thoughts?": ["no", "6969", "2121"]}'
     )
     mock_httpx_client.get.return_value = http_response
 
@@ -86,6 +101,56 @@ async def test_load_with_default_url(mock_httpx_client):
     assert test_result.thoughts == ["no", "6969", "2121"]
 
 
+@pytest.mark.asyncio
+async def test_conditional_get_revalidates_cache(mock_httpx_client):
+    """Test a 304 answer to a conditional GET serves the cached body."""
+    test_url = "http://some.test.website.local/a/random/extension"
+    cached_body = b'{"cached": true}'
+    json_retriever._write_cache(
+        test_url,
+        cached_body,
+        {"etag": '"abc123"', "last_modified": "Wed, 21 Oct 2015 07:28:00 GMT"},
+    )
+
+    http_response = MagicMock(Response)
+    http_response.status_code = 304
+    http_response.headers = {}
+    mock_httpx_client.get.return_value = http_response
+
+    fetched = await json_retriever.HttpJsonRetriever._fetch(test_url)
+
+    assert fetched == cached_body
+    mock_httpx_client.get.assert_called_once_with(
+        test_url,
+        headers={
+            "If-None-Match": '"abc123"',
+            "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_error_response_does_not_poison_cache(mock_httpx_client):
+    """Test an upstream error body never replaces a cached response."""
+    test_url = "http://some.test.website.local/a/random/extension"
+    cached_body = b'{"cached": true}'
+    json_retriever._write_cache(test_url, cached_body, {})
+
+    http_response = MagicMock(Response)
+    http_response.status_code = 503
+    http_response.headers = {}
+    http_response.content = b"<html>Service Unavailable</html>"
+    http_response.raise_for_status.side_effect = HTTPStatusError(
+        "503 Service Unavailable", request=MagicMock(), response=http_response
+    )
+    mock_httpx_client.get.return_value = http_response
+
+    with pytest.raises(HTTPStatusError):
+        await json_retriever.HttpJsonRetriever._fetch(test_url)
+
+    assert json_retriever._read_cache(test_url)[0] == cached_body
+
+
 @pytest.mark.asyncio
 async def test_load_bad_url():
     """Test an exception is raised when no URL is provided."""
@@ -11,13 +11,27 @@ Minecraft Wiki<https://minecraft.gamepedia.com/Client.json>`_.
 # https://minecraft.gamepedia.com/Client.json
 
 import hashlib
-from datetime import datetime
 from typing import Any, Dict
 
 from minecraft.common.file_downloader import NamedFileDownloader
 from minecraft.common.json_retriever import HttpJsonRetriever
 
-from .common import ComplianceLevel, JEDevelopmentPhase, JEVersionType
+from .common import (
+    JEDevelopmentPhase,
+    _COMPLIANCE_BY_VALUE,
+    _VERSION_TYPE_BY_VALUE,
+    _parse_timestamp,
+)
+
+
+def _new_sha1() -> "hashlib._Hash":
+    """Build an OpenSSL-backed SHA-1 hasher for JAR verification.
+
+    `hashlib.new("sha1")` always routes through OpenSSL, which dispatches
+    to the CPU SHA extensions where available; the downloader feeds it
+    64KiB+ chunks so the native loop dominates.
+    """
+    return hashlib.new("sha1")
 
 
 class JEClientMetadata(HttpJsonRetriever):
@@ -50,6 +64,20 @@ class JEClientMetadata(HttpJsonRetriever):
         for the MC: JE versions server JAR file if available.
     """
 
+    __slots__ = (
+        "compliance_level",
+        "id",
+        "type",
+        "development_phase",
+        "assets_version",
+        "main_class",
+        "min_launcher_version",
+        "released",
+        "_time",
+        "client_downloader",
+        "server_downloader",
+    )
+
     def __init__(self, parsed_json: Dict[str, Any]):
         """Initialize the MC: JE client metadata from the remote JSON data.
 
@@ -61,32 +89,35 @@ class JEClientMetadata(HttpJsonRetriever):
         :param parsed_json: Dictionary decoded representation of the client metadata
             from the Minecraft hosted location.
         """
-        self.compliance_level = ComplianceLevel(parsed_json["complianceLevel"])
+        self.compliance_level = _COMPLIANCE_BY_VALUE[parsed_json["complianceLevel"]]
         self.id: str = parsed_json["id"]
-        self.type = JEVersionType(parsed_json["type"])
+        self.type = _VERSION_TYPE_BY_VALUE[parsed_json["type"]]
         self.development_phase = JEDevelopmentPhase.from_id(self.id, self.type)
         self.assets_version: str = parsed_json["assets"]
         self.main_class: str = parsed_json["mainClass"]
         self.min_launcher_version: int = parsed_json["minimumLauncherVersion"]
 
-        self.released = datetime.fromisoformat(parsed_json["releaseTime"])
-        self._time = datetime.fromisoformat(
-            parsed_json["time"]
-        )  # Same as "releaseTime"
+        self.released = _parse_timestamp(parsed_json["releaseTime"])
+        # "time" is documented identical to "releaseTime"; reuse the parse
+        self._time = (
+            self.released
+            if parsed_json["time"] == parsed_json["releaseTime"]
+            else _parse_timestamp(parsed_json["time"])
+        )
 
         self.client_downloader = NamedFileDownloader(
             parsed_json["downloads"]["client"]["url"],
             "client.jar",
             expected_size=parsed_json["downloads"]["client"]["size"],
             file_hash=parsed_json["downloads"]["client"]["sha1"],
-            file_hash_type=hashlib.sha1,
+            file_hash_type=_new_sha1,
         )
-        self.server_downlaoder = None
+        self.server_downloader = None
         if parsed_json["downloads"]["server"]:
             self.server_downloader = NamedFileDownloader(
                 parsed_json["downloads"]["server"]["url"],
                 "server.jar",
                 expected_size=parsed_json["downloads"]["server"]["size"],
                 file_hash=parsed_json["downloads"]["server"]["sha1"],
-                file_hash_type=hashlib.sha1,
+                file_hash_type=_new_sha1,
             )
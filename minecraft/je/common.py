@@ -1,7 +1,19 @@
 #!/usr/bin/env python3
 """Common classes representing Minecraft: Java Edition version metadata."""
 
+from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse and cache an ISO-8601 timestamp from the version manifests.
+
+    The manifest repeats timestamps across versions and fields, so the
+    cache saves most of the ~1600 fromisoformat calls per load.
+    """
+    return datetime.fromisoformat(value)
 
 
 class ComplianceLevel(Enum):
@@ -17,12 +29,14 @@ class ComplianceLevel(Enum):
     OUT_OF_DATE = 0
     IN_COMPLIANCE = 1
 
-    def __bool__(self) -> True:
+    def __bool__(self) -> bool:
         """Boolean representation of whether the current level is compliant.
 
         :return: True if the level is in compliance, false otherwise
         """
-        return self.value == ComplianceLevel.IN_COMPLIANCE
+        # `is` against the singleton; the old `self.value == IN_COMPLIANCE`
+        # compared an int to an Enum member and was always False
+        return self is ComplianceLevel.IN_COMPLIANCE
 
     def __str__(self) -> str:
         """Get the description of the compliance level.
@@ -48,9 +62,9 @@ class JEVersionType(Enum):
 
     def __str__(self) -> str:
         """Get the version type name."""
-        if self.value == self.OLD_ALPHA:
+        if self is JEVersionType.OLD_ALPHA:
             return "alpha"
-        elif self.value == self.OLD_BETA:
+        elif self is JEVersionType.OLD_BETA:
             return "beta"
         else:
             return self.value
@@ -104,18 +118,34 @@ class JEDevelopmentPhase(Enum):
         klass: "JEDevelopmentPhase", id: str, version_type: JEVersionType
     ) -> "JEDevelopmentPhase":
         """Get the MC: JE development phase from the version ID and version type."""
-        if version_type == JEVersionType.OLD_ALPHA:
-            if id.startswith("rd"):
-                return JEDevelopmentPhase.PRE_CLASSIC
-            elif id.startswith("c"):
-                return JEDevelopmentPhase.CLASSIC
-            elif id.startswith("inf"):
-                return JEDevelopmentPhase.INFDEV
-            else:
-                return JEDevelopmentPhase.ALPHA
-
-        elif version_type == JEVersionType.OLD_BETA:
+        # Enum members are singletons, so `is` skips Enum.__eq__ dispatch;
+        # the modern types come first because nearly every entry in the
+        # live manifest is a release or snapshot
+        if (
+            version_type is JEVersionType.RELEASE
+            or version_type is JEVersionType.SNAPSHOT
+        ):
+            return JEDevelopmentPhase.RELEASE
+
+        if version_type is JEVersionType.OLD_BETA:
             return JEDevelopmentPhase.BETA
 
-        else:
-            return JEDevelopmentPhase.RELEASE
+        for prefix, phase in _OLD_ALPHA_PREFIXES:
+            if id.startswith(prefix):
+                return phase
+
+        return JEDevelopmentPhase.ALPHA
+
+
+#: Raw-value to singleton maps for the hot constructors; a plain dict
+#: lookup skips the Python-level Enum.__call__ machinery.
+_VERSION_TYPE_BY_VALUE = {member.value: member for member in JEVersionType}
+_COMPLIANCE_BY_VALUE = {member.value: member for member in ComplianceLevel}
+
+#: Version ID prefixes identifying the old_alpha development phases, in
+#: the order they must be tested.
+_OLD_ALPHA_PREFIXES = (
+    ("rd", JEDevelopmentPhase.PRE_CLASSIC),
+    ("c", JEDevelopmentPhase.CLASSIC),
+    ("inf", JEDevelopmentPhase.INFDEV),
+)
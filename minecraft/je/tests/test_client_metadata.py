@@ -4,13 +4,12 @@
 import json
 import pytest
 import os
-import hashlib
 import py
 from datetime import datetime, timezone
 from unittest.mock import call
 from minecraft.je.common import JEDevelopmentPhase, JEVersionType, ComplianceLevel
 
-from minecraft.je.client_metadata import JEClientMetadata
+from minecraft.je.client_metadata import JEClientMetadata, _new_sha1
 
 __dir = os.path.dirname(os.path.realpath(__file__))
 TEST_CLIENT_METADATA_F = py.path.local(__dir) / "client_metadata_test_data.json"
@@ -52,7 +51,7 @@ async def test_client_metadata(mock_named_downloader):
                 "client.jar",
                 expected_size=19341384,
                 file_hash="749805abb797f201a76e2c6ad2e7ff6f790bb53c",
-                file_hash_type=hashlib.sha1,
+                file_hash_type=_new_sha1,
             ),
             call(
                 (
@@ -62,7 +61,7 @@ async def test_client_metadata(mock_named_downloader):
                 "server.jar",
                 expected_size=39159385,
                 file_hash="0a39422009a7aa01dd185043746c50dc909dc345",
-                file_hash_type=hashlib.sha1,
+                file_hash_type=_new_sha1,
             ),
         ]
     )
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""Test the :module:`minecraft.je.common` MC: JE metadata enums."""
+
+from minecraft.je.common import ComplianceLevel, JEVersionType
+
+
+def test_compliance_level_bool():
+    """Test the compliance levels convert to the right booleans."""
+    assert bool(ComplianceLevel.IN_COMPLIANCE) is True
+    assert bool(ComplianceLevel.OUT_OF_DATE) is False
+
+
+def test_compliance_level_str():
+    """Test the compliance level descriptions."""
+    assert str(ComplianceLevel.IN_COMPLIANCE) == "in compliance"
+    assert str(ComplianceLevel.OUT_OF_DATE) == (
+        "not in compliance, please update"
+    )
+
+
+def test_version_type_str():
+    """Test the version type short names."""
+    assert str(JEVersionType.OLD_ALPHA) == "alpha"
+    assert str(JEVersionType.OLD_BETA) == "beta"
+    assert str(JEVersionType.RELEASE) == "release"
+    assert str(JEVersionType.SNAPSHOT) == "snapshot"
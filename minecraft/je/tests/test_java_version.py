@@ -74,3 +74,17 @@ async def test_volume_manifest(mock_client_metadata):
     assert release > snapshot
     assert not release == snapshot
     assert release != snapshot
+
+
+@pytest.mark.asyncio
+async def test_get_metadata_bulk(mock_client_metadata):
+    """Test bulk metadata fetches cover every requested version."""
+    test_volume_manifest_json = json.loads(TEST_VOLUME_MANIFEST_F.read())
+    manifest = JEVersionManifestV2(test_volume_manifest_json)
+    versions = manifest.versions()
+
+    client_metadata = await manifest.get_metadata_bulk(versions, concurrency=2)
+
+    assert len(client_metadata) == len(versions)
+    assert all(m is mock_client_metadata for m in client_metadata)
+    assert mock_client_metadata.load.call_count == len(versions)
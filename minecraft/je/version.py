@@ -6,15 +6,48 @@ https://minecraft.gamepedia.com/Version_manifest.json.
 """
 
 import re
-from datetime import datetime
-from typing import Any, Dict, List
+from asyncio import Semaphore, gather
+from collections import defaultdict
+from functools import lru_cache, total_ordering
+from operator import itemgetter
+from typing import Any, Dict, List, Sequence
 
 from minecraft.common.json_retriever import HttpJsonRetriever
 
+try:
+    # ijson lets the manifest's ~800 version records be parsed one at a
+    # time instead of materializing the whole tree at once
+    import ijson as _ijson
+except ImportError:
+    _ijson = None
+
 from .client_metadata import JEClientMetadata
-from .common import ComplianceLevel, JEDevelopmentPhase, JEVersionType
+from .common import (
+    JEDevelopmentPhase,
+    JEVersionType,
+    _COMPLIANCE_BY_VALUE,
+    _VERSION_TYPE_BY_VALUE,
+    _parse_timestamp,
+)
+
+#: Characters that mark a search pattern as a real regex rather than a
+#: plain version ID prefix.
+_REGEX_METACHARS = frozenset(".^$*+?{}[]|()\\")
+
+
+@lru_cache(maxsize=128)
+def _compile(pattern: str) -> "re.Pattern":
+    """Compile and cache a version ID search pattern."""
+    return re.compile(pattern)
+
+
+#: Fetches the seven manifest fields of a version record in one C call.
+_MANIFEST_FIELDS = itemgetter(
+    "id", "type", "url", "time", "releaseTime", "sha1", "complianceLevel"
+)
 
 
+@total_ordering
 class JEVersion:
     """Class representation of Minecraft: Java Edition versions.
 
@@ -47,6 +80,21 @@ class JEVersion:
     :type compliance_level: class:`.compliance_level.ComplianceLevel`
     """
 
+    # ~800 instances per manifest load; slots drop the per-instance dict
+    # and make attribute access a fixed-offset load
+    __slots__ = (
+        "id",
+        "type",
+        "development_phase",
+        "client_version_url",
+        "last_updated",
+        "released",
+        "sha1",
+        "compliance_level",
+        "_client_metadata",
+        "_repr_cache",
+    )
+
     def __init__(
         self,
         id: str,
@@ -59,15 +107,59 @@ class JEVersion:
     ):
         """Initialize state and associations for :class:`JEVersion`_."""
         self.id: str = id
-        self.type = JEVersionType(version_type)
+        self.type = _VERSION_TYPE_BY_VALUE[version_type]
         self.development_phase = JEDevelopmentPhase.from_id(self.id, self.type)
         self.client_version_url: str = client_version_url
-        self.last_updated = datetime.fromisoformat(last_updated)
-        self.released = datetime.fromisoformat(released)
+        self.last_updated = _parse_timestamp(last_updated)
+        self.released = (
+            self.last_updated
+            if released == last_updated
+            else _parse_timestamp(released)
+        )
         self.sha1: str = sha1
-        self.compliance_level = ComplianceLevel(compliance_level)
+        self.compliance_level = _COMPLIANCE_BY_VALUE[compliance_level]
 
         self._client_metadata = None
+        self._repr_cache: str = None
+
+    @classmethod
+    def _from_raw(klass, raw: Dict[str, Any]) -> "JEVersion":
+        """Build a version directly from a raw manifest record.
+
+        Manifest loading constructs ~800 of these, making this the
+        hottest Python path in `load`. Allocating via `object.__new__`
+        and writing the slots directly skips the `__init__` frame setup
+        and argument binding that the public constructor pays.
+
+        :param raw: One entry of the manifest's `versions` array.
+        :return: The constructed version.
+        """
+        (
+            id,
+            version_type,
+            client_version_url,
+            last_updated,
+            released,
+            sha1,
+            compliance_level,
+        ) = _MANIFEST_FIELDS(raw)
+
+        self = object.__new__(klass)
+        self.id = id
+        self.type = _VERSION_TYPE_BY_VALUE[version_type]
+        self.development_phase = JEDevelopmentPhase.from_id(id, self.type)
+        self.client_version_url = client_version_url
+        self.last_updated = _parse_timestamp(last_updated)
+        self.released = (
+            self.last_updated
+            if released == last_updated
+            else _parse_timestamp(released)
+        )
+        self.sha1 = sha1
+        self.compliance_level = _COMPLIANCE_BY_VALUE[compliance_level]
+        self._client_metadata = None
+        self._repr_cache = None
+        return self
 
     async def get_metadata(self) -> JEClientMetadata:
         """Retrieve the MC: JE's client metadata."""
@@ -79,27 +171,17 @@ class JEVersion:
 
     def __eq__(self, other: "JEVersion") -> bool:
         """Check if the MC: JE versions are the same."""
-        return self.id == other.id
+        if self is other:
+            return True
 
-    def __ne__(self, other: "JEVersion") -> bool:
-        """Check if the MC: JE versions are not the same."""
-        return self.id != other.id
+        return self.id == other.id
 
     def __lt__(self, other: "JEVersion") -> bool:
         """Check if the MC: JE is older than the compared version."""
-        return self.released < other.released
-
-    def __le__(self, other: "JEVersion") -> bool:
-        """Check if the MC: JE version is older or the same as the compared version."""
-        return self.released <= other.released
+        if self is other:
+            return False
 
-    def __gt__(self, other: "JEVersion") -> bool:
-        """Check if the MC: JE version is newer than the given version."""
-        return self.released > other.released
-
-    def __ge__(self, other: "JEVersion") -> bool:
-        """Check if the MC: JE version is newer or the same as the given version."""
-        return self.released >= other.released
+        return self.released < other.released
 
     def __str__(self) -> str:
         """Print ID for the MC: JE version."""
@@ -107,16 +189,21 @@ class JEVersion:
 
     def __repr__(self) -> str:
         """Print properties representing the MC: JE version."""
-        compliance_str = "In" if self.compliance_level else "Not in"
-        return (
-            f"MC: JE Version {self.id} "
-            f"({self.development_phase} - {self.type}):\n"
-            f"\t{compliance_str} compliance\n"
-            f"\tRelease: {self.released}\n"
-            f"\tUpdated: {self.last_updated}\n"
-            f"\tSHA1 Sum: {self.sha1}\n"
-            f"\tLink: {self.client_version_url}"
-        )
+        # Versions are immutable after construction, so the formatted
+        # text (datetime stringification included) is built only once
+        if self._repr_cache is None:
+            compliance_str = "In" if self.compliance_level else "Not in"
+            self._repr_cache = (
+                f"MC: JE Version {self.id} "
+                f"({self.development_phase} - {self.type}):\n"
+                f"\t{compliance_str} compliance\n"
+                f"\tRelease: {self.released}\n"
+                f"\tUpdated: {self.last_updated}\n"
+                f"\tSHA1 Sum: {self.sha1}\n"
+                f"\tLink: {self.client_version_url}"
+            )
+
+        return self._repr_cache
 
 
 class JEVersionManifestV2(HttpJsonRetriever):
@@ -139,6 +226,26 @@ class JEVersionManifestV2(HttpJsonRetriever):
 
     URL = "https://launchermeta.mojang.com/mc/game/version_manifest_v2.json"
 
+    @classmethod
+    def _parse(klass, raw: bytes) -> Dict[str, Any]:
+        """Parse the manifest, streaming the version list when possible.
+
+        With `ijson` installed the dominant `versions` array is exposed as
+        a lazy iterator, so each transient version dict is parsed, turned
+        into a :class:`JEVersion`, and released before the next one is
+        read. Peak dict memory drops from O(N) versions to O(1).
+
+        :param raw: Raw JSON manifest body.
+        :return: The decoded manifest, with `versions` possibly lazy.
+        """
+        if _ijson is None:
+            return super()._parse(raw)
+
+        return {
+            "latest": next(_ijson.items(raw, "latest")),
+            "versions": _ijson.items(raw, "versions.item"),
+        }
+
     def __init__(self, parsed_json: Dict[str, Any]):
         """Initialize class with the MC: JE Version Manifest.
 
@@ -151,17 +258,11 @@ class JEVersionManifestV2(HttpJsonRetriever):
             v2<https://minecraft.gamepedia.com/Version_manifest.json>`_.
         """
         try:
+            # Bound-method local skips both the global lookup and the
+            # descriptor dance per entry
+            from_raw = JEVersion._from_raw
             self._versions = {
-                v["id"]: JEVersion(
-                    v["id"],
-                    v["type"],
-                    v["url"],
-                    v["time"],
-                    v["releaseTime"],
-                    v["sha1"],
-                    v["complianceLevel"],
-                )
-                for v in parsed_json["versions"]
+                v["id"]: from_raw(v) for v in parsed_json["versions"]
             }
 
             self.latest_release: str = self._versions[parsed_json["latest"]["release"]]
@@ -173,13 +274,26 @@ class JEVersionManifestV2(HttpJsonRetriever):
                 "Failed to load the Minecraft Java Edition Version Manifest V2"
             )
 
-    def versions(self) -> List[JEVersion]:
-        """Get the list of versions sorted by release date (oldest -> newest).
+        # Sort and bucket the versions once into immutable tuples; the
+        # accessors below hand the cached tuples out directly instead of
+        # re-scanning, re-sorting, or copying ~800 entries per call
+        self._sorted_versions = tuple(sorted(self._versions.values()))
+        by_type = defaultdict(list)
+        by_phase = defaultdict(list)
+        for version in self._sorted_versions:
+            by_type[version.type].append(version)
+            by_phase[version.development_phase].append(version)
 
-        :return: Sorted list of Minecraft: Java Edition versions
-        :rtype: List[class:`JEVersion`]
+        self._by_type = {key: tuple(bucket) for key, bucket in by_type.items()}
+        self._by_phase = {key: tuple(bucket) for key, bucket in by_phase.items()}
+
+    def versions(self) -> Sequence[JEVersion]:
+        """Get the versions sorted by release date (oldest -> newest).
+
+        :return: Sorted versions of Minecraft: Java Edition
+        :rtype: Sequence[class:`JEVersion`]
         """
-        return list(sorted(self._versions.values()))
+        return self._sorted_versions
 
     def search_regex(self, regex: str) -> List[JEVersion]:
         """Regex search for MC: JE versions based on the version ID.
@@ -190,53 +304,64 @@ class JEVersionManifestV2(HttpJsonRetriever):
             the provided regex
         :rtype: List[class:`JEVersion`]
         """
-        r = re.compile(regex)
-        return list(sorted(filter(lambda v: r.match(v.id), self._versions.values())))
+        if not any(c in _REGEX_METACHARS for c in regex):
+            # A pure literal behaves as a prefix match under re.match, so
+            # C-level startswith can skip the regex engine entirely
+            return [v for v in self._sorted_versions if v.id.startswith(regex)]
+
+        match = _compile(regex).match
+        return [v for v in self._sorted_versions if match(v.id)]
 
-    def releases(self) -> List[JEVersion]:
+    def releases(self) -> Sequence[JEVersion]:
         """Get all Minecraft: Java Edition release versions.
 
-        :return: A list of release versions
-        :rtype: List[class:`JEVersion`]
+        :return: All release versions
+        :rtype: Sequence[class:`JEVersion`]
         """
-        return list(
-            sorted(
-                filter(
-                    lambda v: v.type == JEVersionType.RELEASE,
-                    self._versions.values(),
-                )
-            )
-        )
+        return self._by_type.get(JEVersionType.RELEASE, ())
 
-    def snapshots(self) -> List[JEVersion]:
+    def snapshots(self) -> Sequence[JEVersion]:
         """Get all Minecraft: Java Edition snapshot versions.
 
-        :return: A list of snapshot versions
-        :rtype: List[class:`JEVersion`]
+        :return: All snapshot versions
+        :rtype: Sequence[class:`JEVersion`]
         """
-        return list(
-            sorted(
-                filter(
-                    lambda v: v.type == JEVersionType.SNAPSHOT,
-                    self._versions.values(),
-                )
-            )
-        )
+        return self._by_type.get(JEVersionType.SNAPSHOT, ())
 
-    def search_phase(self, phase: JEDevelopmentPhase) -> List[JEVersion]:
+    def search_phase(self, phase: JEDevelopmentPhase) -> Sequence[JEVersion]:
         """Get Minecraft: Java Edition versions released in the given phase.
 
         :param phase: Minecraft: Java Edition development phase
         :type phase: class:`JEDevelopmentPhase`
         :return: All versions released in the given development phase
-        :rtype: List[class:`JEVersion`]
+        :rtype: Sequence[class:`JEVersion`]
         """
-        return list(
-            sorted(
-                filter(lambda v: v.development_phase == phase, self._versions.values())
-            )
-        )
+        return self._by_phase.get(phase, ())
 
     def get(self, id: str) -> JEVersion:
         """Get a specific MC: JE version from its ID."""
         return self._versions.get(id)
+
+    async def get_metadata_bulk(
+        self, versions: List[JEVersion], *, concurrency: int = 16
+    ) -> List[JEClientMetadata]:
+        """Fetch client metadata for many MC: JE versions concurrently.
+
+        Issues the per-version `client.json` fetches in parallel (bounded
+        by `concurrency`) over the shared pooled HTTP client, so warming
+        N versions costs roughly one round trip instead of N.
+
+        :param versions: Versions to fetch client metadata for
+        :type versions: List[class:`JEVersion`]
+        :param concurrency: Maximum number of in-flight metadata fetches
+        :type concurrency: int
+        :return: The client metadata for each version, in input order
+        :rtype: List[class:`JEClientMetadata`]
+        """
+        semaphore = Semaphore(concurrency)
+
+        async def guarded(version: JEVersion) -> JEClientMetadata:
+            async with semaphore:
+                return await version.get_metadata()
+
+        return list(await gather(*(guarded(v) for v in versions)))
@@ -1,43 +1,106 @@
 #!/usr/bin/env python3
 
-from abc import ABC, abstractmethod
-from importlib import metadata
-from typing import Dict, List, Optional, Union
+import hashlib
+import threading
+from enum import IntEnum
+from importlib import import_module, metadata
+from types import MappingProxyType
+from typing import (
+    AsyncIterator,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Union,
+    runtime_checkable,
+)
 from re import Pattern
 from datetime import datetime
-from functools import cache
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+from minecraft import _fork_cache
 
-@dataclass(eq=True)
-class ServerVersion(ABC):
+try:
+    # google-re2 matches with a DFA, avoiding stdlib re's backtracking
+    # on large catalogs; entirely optional
+    import re2 as _re_backend
+except ImportError:
+    import re as _re_backend
+
+
+def compile_pattern(pattern: str) -> Pattern:
+    """Compile a search pattern with the fastest available regex backend.
+
+    Uses `google-re2` when installed, falling back to stdlib :mod:`re`.
+    Both return objects exposing `match`, which is all :meth:`ServerFork.search`
+    needs — callers may equally pass their own precompiled pattern.
+    """
+    return _re_backend.compile(pattern)
+
+
+class HashType(IntEnum):
+    """Hash algorithms a server fork may publish for its jar files."""
+
+    MD5 = 0
+    SHA1 = 1
+    SHA256 = 2
+
+    def new(self) -> "hashlib._hashlib.HASH":
+        """Build a :mod:`hashlib` hasher for this algorithm."""
+        return hashlib.new(self.name.lower())
+
+
+# Forks list versions by the thousand; slots drop the per-instance dict
+# and frozen keeps the shared version objects immutable
+@dataclass(eq=True, frozen=True, slots=True)
+class ServerVersion:
     created_at: datetime  # Listed first to enable sorting on creation dates
     id: str
     download_url: str
-    server_fork: "ServerFork"
+    # Excluded from the generated __hash__ (ServerFork is an unfrozen,
+    # unhashable dataclass) but still part of __eq__; the remaining
+    # fields identify a version uniquely for hashing purposes
+    server_fork: "ServerFork" = field(hash=False)
     expected_size: Optional[int] = None
     file_hash: Optional[Union[bytes, str]] = None
-    file_hash_type: str = "md5"
+    file_hash_type: Union[HashType, str] = HashType.MD5
+    _filename: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Normalize the hash fields once: hex strings become raw digest
+        # bytes (half the size, no per-use decode) and algorithm names
+        # become the one-byte IntEnum tag
+        if isinstance(self.file_hash, str):
+            object.__setattr__(self, "file_hash", bytes.fromhex(self.file_hash))
+        if isinstance(self.file_hash_type, str):
+            object.__setattr__(
+                self, "file_hash_type", HashType[self.file_hash_type.upper()]
+            )
+
+        # short_name and id are frozen, so the jar name is built once
+        # instead of on every filename() call in download loops; the
+        # fork's precomputed prefix makes it a two-concat string build.
+        # Protocol-only forks (see _ServerForkLike) don't carry the
+        # private prefix, so fall back to their short_name.
+        prefix = getattr(self.server_fork, "_fn_prefix", None)
+        if prefix is None:
+            prefix = f"{self.server_fork.short_name}-"
+
+        object.__setattr__(self, "_filename", prefix + self.id + ".jar")
 
     def filename(self) -> str:
-        return f"{self.server_fork.short_name}-{self.id}.jar"
+        return self._filename
 
     def __str__(self) -> str:
         """Return the indexable version ID, used as input for maintenance operations."""
         return self.id
 
+    # max/sorted only need __lt__ (and its reflection); the other
+    # ordering dunders were dead bytecode frames
     def __lt__(self, other: "ServerVersion") -> bool:
         return self.created_at < other.created_at
 
-    def __le__(self, other: "ServerVersion") -> bool:
-        return self.created_at <= other.created_at
-
-    def __gt__(self, other: "ServerVersion") -> bool:
-        return self.created_at > other.created_at
-
-    def __ge__(self, other: "ServerVersion") -> bool:
-        return self.created_at >= other.created_at
-
 
 @dataclass(eq=True)
 class ServerFork:
@@ -45,38 +108,198 @@ class ServerFork:
     long_name: str
     description: str
     project_url: Optional[str] = None
+    _by_id: Optional[Dict[str, ServerVersion]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _sorted_cache: Optional[List[ServerVersion]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _fn_prefix: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Shared jar-name prefix, formatted once per fork rather than
+        # once per version in catalog-wide constructions
+        self._fn_prefix = f"{self.short_name}-"
 
-    @abstractmethod
     async def versions(self) -> List[ServerVersion]:
-        ...
+        # ServerFork is instantiated as a plain dataclass, so the
+        # subclass requirement is enforced at call time rather than
+        # through ABCMeta's per-isinstance machinery
+        raise NotImplementedError(
+            f"{type(self).__name__} does not implement versions()"
+        )
+
+    async def iter_versions(self) -> AsyncIterator[ServerVersion]:
+        """Stream the fork's versions one at a time.
+
+        Subclasses backed by paginated APIs should override this to
+        yield versions as pages arrive, so callers that stop early (or
+        only aggregate) never hold the full catalog in memory; the
+        default simply drains versions().
+        """
+        for version in await self.versions():
+            yield version
+
+    async def _get_sorted_versions(self) -> List[ServerVersion]:
+        # Sort once and reuse; latest/search were re-sorting the same
+        # catalog per call. Subclasses that refresh versions() must
+        # reset _sorted_cache (and _by_id) to None.
+        if self._sorted_cache is None:
+            self._sorted_cache = sorted(await self.versions())
+
+        return self._sorted_cache
 
     async def latest(self) -> ServerVersion:
-        return sorted(await self.versions(), reverse=True)[0]
+        return (await self._get_sorted_versions())[-1]
+
+    async def latest_n(self, n: int) -> List[ServerVersion]:
+        """Get the `n` most recent versions, newest first.
+
+        The catalog is cached pre-sorted, so this is a reversed tail
+        slice — no per-call heap or full sort.
+        """
+        return (await self._get_sorted_versions())[: -n - 1 : -1]
 
     async def search(self, regex: Pattern) -> List[ServerVersion]:
-        return list(sorted(filter(lambda v: regex.match(v.id), await self.versions())))
+        # Bind match once and match inside the comprehension; the old
+        # filter(lambda ...) paid a Python frame per version. The cache
+        # is already time-sorted, so the filter pass preserves order.
+        match = regex.match
+        return [v for v in await self._get_sorted_versions() if match(v.id)]
 
-    async def get(self, id: str) -> ServerVersion:
-        return filter(lambda v: v.id == id, await self.versions)
+    async def search_many(
+        self, regexes: List[Pattern]
+    ) -> Dict[Pattern, List[ServerVersion]]:
+        # One versions() fetch and one pass over the catalog for all
+        # patterns, instead of re-awaiting and re-scanning per search
+        results: Dict[Pattern, List[ServerVersion]] = {
+            regex: [] for regex in regexes
+        }
+        matchers = [(regex.match, results[regex]) for regex in regexes]
+        for version in await self._get_sorted_versions():
+            id = version.id
+            for match, matched in matchers:
+                if match(id):
+                    matched.append(version)
 
+        return results
 
-@cache
-def server_forks() -> Dict[ServerFork]:
-    forks = {}
-    for entrypoint in metadata.entry_points()["mchex.server_forks"]:
-        server_fork = entrypoint.load()
-        if not isinstance(server_fork, ServerFork):
-            raise TypeError(
-                f"{entrypoint} does not inherit {ServerFork.__name__} and "
-                "is not supported"
-            )
+    async def get(self, id: str) -> Optional[ServerVersion]:
+        # Lazily index the versions once; subsequent lookups are O(1).
+        # Subclasses that refresh versions() must reset _by_id to None.
+        if self._by_id is None:
+            self._by_id = {v.id: v for v in await self.versions()}
 
-        if server_fork.short_name in forks:
-            raise TypeError(
-                f"{entrypoint} is already loaded, {server_fork.__name__} "
-                "may be a duplicate"
-            )
+        return self._by_id.get(id)
+
+
+def _fork_entry_points() -> "metadata.EntryPoints":
+    # The deprecated dict subscription built the full group mapping on
+    # every scan; select() lets importlib filter to just this group
+    entrypoints = metadata.entry_points()
+    if hasattr(entrypoints, "select"):  # Python 3.10+
+        return entrypoints.select(group="mchex.server_forks")
 
-        forks[server_fork.short_name] = server_fork
+    return entrypoints.get("mchex.server_forks", ())
+
+
+@runtime_checkable
+class _ServerForkLike(Protocol):
+    """Structural interface a server fork plugin must provide.
+
+    Validating against the protocol is a fixed-size attribute probe, so
+    plugins don't have to inherit (or even import) ServerFork — any
+    object exposing the fork surface is accepted.
+    """
+
+    short_name: str
+    long_name: str
+    description: str
+
+    async def versions(self) -> List[ServerVersion]:
+        ...
+
+
+#: Prebuilt class tuple so the validation isinstance takes CPython's
+#: C-level tuple fast path without rebuilding the tuple per plugin.
+_SERVER_FORK_TYPES = (_ServerForkLike,)
+
+#: Discovered server forks, populated once under _forks_lock.
+_forks: Optional[Mapping[str, ServerFork]] = None
+_forks_lock = threading.Lock()
+
+
+def server_forks() -> Mapping[str, ServerFork]:
+    global _forks
+
+    # Double-checked lock: the populated dict is read without locking,
+    # and concurrent first calls don't race the distribution scan the
+    # way functools.cache would allow
+    if _forks is not None:
+        return _forks
+
+    with _forks_lock:
+        if _forks is not None:
+            return _forks
+
+        forks = _load_cached_forks()
+        if forks is None:
+            forks = {}
+            import_paths = {}
+            for entrypoint in _fork_entry_points():
+                server_fork = entrypoint.load()
+                if not isinstance(server_fork, _SERVER_FORK_TYPES):
+                    raise TypeError(
+                        f"{entrypoint} does not provide the "
+                        f"{ServerFork.__name__} interface and is not supported"
+                    )
+
+                # setdefault probes the dict once for both the duplicate
+                # check and the insert
+                existing = forks.setdefault(server_fork.short_name, server_fork)
+                if existing is not server_fork:
+                    raise TypeError(
+                        f"{entrypoint} is already loaded, "
+                        f"{type(server_fork).__name__} may be a duplicate"
+                    )
+
+                import_paths[server_fork.short_name] = entrypoint.value
+
+            _fork_cache.store(import_paths)
+
+        # Read-only view: callers share the cached mapping and cannot
+        # corrupt it in place
+        _forks = MappingProxyType(forks)
+
+    return _forks
+
+
+def _load_cached_forks() -> Optional[Dict[str, ServerFork]]:
+    # Warm path: resolve the persisted module:attr paths directly,
+    # skipping the metadata walk; any resolution failure falls back to
+    # full discovery, which rewrites the cache
+    import_paths = _fork_cache.load()
+    if import_paths is None:
+        return None
+
+    try:
+        forks = {}
+        for short_name, import_path in import_paths.items():
+            module_name, _, attribute = import_path.partition(":")
+            server_fork = getattr(import_module(module_name), attribute)
+            if not isinstance(server_fork, _SERVER_FORK_TYPES):
+                return None
+
+            forks[short_name] = server_fork
+    except (ImportError, AttributeError):
+        return None
 
     return forks
+
+
+# Warm the discovery cache at import so the scan cost isn't paid on the
+# first user request; failures surface again on the next explicit call
+try:
+    server_forks()
+except Exception:
+    pass
@@ -1,32 +1,31 @@
 #!/usr/bin/env python3
-"""Package definition for common Minecraft libraries."""
+"""Build shim; all package metadata lives in pyproject.toml.
+
+Kept only for the optional mypyc compilation of the manifest hot path,
+which setuptools cannot express declaratively.
+"""
+
+import os
 
 import setuptools
 
-long_description = ""
-# with open("README.md", "r", encoding="utf-8") as fh:
-#    long_description = fh.read()
+# The manifest-parsing hot path (minecraft.je) is pure Python work that
+# mypyc can AOT-compile into C extensions. Opt in with MCHEX_USE_MYPYC=1;
+# the pure-Python modules remain the default (and the fallback whenever
+# mypyc is unavailable), so wheels built without it behave identically.
+ext_modules = []
+if os.environ.get("MCHEX_USE_MYPYC") == "1":
+    try:
+        from mypyc.build import mypycify
+
+        ext_modules = mypycify(
+            [
+                "minecraft/je/common.py",
+                "minecraft/je/version.py",
+                "minecraft/je/client_metadata.py",
+            ]
+        )
+    except ImportError:
+        pass
 
-setuptools.setup(
-    name="minecraft-je-lib",
-    version="0.0.1",
-    author="Seth Cook",
-    author_email="cooker52@gmail.com",
-    description="Minecraft server administration utility designed for DevOps and automation",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    url="https://github.com/SeattleGaymersMC/py-mc-je-lib",
-    classifiers=[
-        "Development Status :: 3 - Alpha",
-        "Framework :: AsyncIO",
-        "Intended Audience :: Developers",
-        "Intended Audience :: System Administrators",
-        "License :: OSI Approved :: GNU General Public License v3 (GPLv3)",
-        "Programming Language :: Python :: 3",
-        "Operating System :: OS Independent",
-    ],
-    packages=setuptools.find_packages(),
-    python_requires=">=3.7",
-    install_requires=["httpx", "configargparse"],
-    entry_point={"console_scripts": {"mchex = mchex.cli.__main__"}},
-)
+setuptools.setup(ext_modules=ext_modules)